@@ -16,21 +16,20 @@ N = 100  # Number of points
 OG_dimensionless = np.array(
     [0, 0]
 )  # dimensionless horizontal and vertical offset from center of rectangle
-GZ = []  # List containing the righting arm for different angle
 
 """rectangle sitting on water"""
 
 alpha_deg = np.linspace(
     0, 90, N
 )  # We stop at 90 degrees because afterward the point of contact is changing.
-GZ.append(0)  # No torque when rectangle is at horizontal
-for i in range(N - 1):
-    OG = OG_dimensionless * np.array([width, height])
-    CG = (
-        width / 2 + OG[0] + (height / 2 + OG[1]) * 1j
-    )  # Define vector from corner to center of gravity using complex
-    CG_rotated = CG * np.exp(1j * np.radians(alpha_deg[i + 1]))
-    GZ.append(CG_rotated.real)  # Take real part to project on horizontal axis
+OG = OG_dimensionless * np.array([width, height])
+CG = (
+    width / 2 + OG[0] + (height / 2 + OG[1]) * 1j
+)  # Define vector from corner to center of gravity using complex
+# Rotate CG for all angles at once and take the real part to project on
+# the horizontal axis
+GZ = np.real(CG * np.exp(1j * np.radians(alpha_deg)))
+GZ[0] = 0  # No torque when rectangle is at horizontal
 
 plt.plot(alpha_deg, GZ)
 plt.title("GZ rectangle on water")
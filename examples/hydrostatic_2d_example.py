@@ -11,71 +11,143 @@ from hydrostatic.hydrostatic_2d import (
 from hydrostatic.sample_boats_2d import generate_circular_boat
 from mouse_interaction import get_mouse_clicks
 
-# Duplicated first point in last position to get a polygon
-input_curve_points, _ = generate_circular_boat()
-input_curve_points = close_curve(input_curve_points)
-center_of_gravity = (0, 0)
-target_area = 0.1  # Set the desired submerged area
-eq = find_equilibrium_points(
-    curve_points=input_curve_points,
-    center_of_gravity=center_of_gravity,
-    target_area=target_area,
-    plot=True,
-)
 
-print("Demo catamaran")
-
-curve_points = [
-    [-1, -1],
-    [-2, -1],
-    [-2, -2],
-    [-1, -2],
-    [-1, -1],
-    [1, -1],
-    [1, -2],
-    [2, -2],
-    [2, -1],
-    [1, -1],
-]
-center_of_gravity = [0, 0]
-# Duplicated first point in last position to get a polygon
-curve_points = close_curve(curve_points)
-target_area = 0.5
-eq = find_equilibrium_points(
-    curve_points=curve_points,
-    center_of_gravity=center_of_gravity,
-    target_area=target_area,
-    plot=True,
-)
+def demo_circular_boat():
+    """Equilibrium points of the circular sample boat."""
+    # Duplicated first point in last position to get a polygon
+    input_curve_points, _ = generate_circular_boat()
+    input_curve_points = close_curve(input_curve_points)
+    center_of_gravity = (0, 0)
+    target_area = 0.1  # Set the desired submerged area
+    find_equilibrium_points(
+        curve_points=input_curve_points,
+        center_of_gravity=center_of_gravity,
+        target_area=target_area,
+        plot=True,
+    )
 
-# Step 1: Define a Closed NURBS Curve
-curve = NURBS.Curve()
-curve.degree = 3
-curve.ctrlpts = [
-    [0.0, 2.0],  # Control points
-    [2.0, 3.0],
-    [4.0, 2.0],
-    [3.0, -2.0],
-    [1.0, -2.0],
-    [-1.0, 0.0],  # Close the curve by duplicating the starting control point
-    [0.0, 2.0],
-]
-curve.knotvector = [0, 0, 0, 0, 1, 2, 3, 4, 4, 4, 4]  # Closed curve knot vector
-curve.delta = 0.01  # Set resolution for sampling
-
-# Evaluate points on the curve
-curve_points = curve.evalpts
-target_area = 1.0  # Set the desired submerged area
-input_curve_points = get_mouse_clicks(
-    "Draw polygon by clicking on vertices and \n double click at center of gravity to finish."
-)
-center_of_gravity = input_curve_points.pop()
-# Duplicated first point in last position to get a polygon
-input_curve_points = close_curve(input_curve_points)
-
-eq = find_equilibrium_points(
-    curve_points=input_curve_points,
-    center_of_gravity=center_of_gravity,
-    target_area=target_area,
-    plot=True,
-)
+
+def demo_catamaran():
+    """Equilibrium points of a twin-hull (catamaran) polygon."""
+    print("Demo catamaran")
+
+    curve_points = [
+        [-1, -1],
+        [-2, -1],
+        [-2, -2],
+        [-1, -2],
+        [-1, -1],
+        [1, -1],
+        [1, -2],
+        [2, -2],
+        [2, -1],
+        [1, -1],
+    ]
+    center_of_gravity = [0, 0]
+    # Duplicated first point in last position to get a polygon
+    curve_points = close_curve(curve_points)
+    target_area = 0.5
+    find_equilibrium_points(
+        curve_points=curve_points,
+        center_of_gravity=center_of_gravity,
+        target_area=target_area,
+        plot=True,
+    )
+
+
+def sample_curve_adaptively(
+    curve, u_start: float, u_end: float, tolerance: float = 1e-3, max_depth: int = 12
+) -> list[list[float]]:
+    """Sample a parametric curve with density driven by local curvature.
+
+    A parameter interval is split in two as long as its midpoint deviates
+    from the chord by more than the tolerance, so flat stretches get few
+    points and tight bends get many (instead of a uniform delta).
+
+    Args:
+        curve: geomdl curve exposing evaluate_single(u)
+        u_start (float): start of the parameter interval
+        u_end (float): end of the parameter interval
+        tolerance (float): maximum allowed chord deviation
+        max_depth (int): maximum number of recursive splits
+
+    Returns:
+        list[list[float]]: points evaluated along the curve
+    """
+
+    def refine(u0, u1, p0, p1, depth):
+        u_mid = 0.5 * (u0 + u1)
+        p_mid = curve.evaluate_single(u_mid)
+        # Deviation of the midpoint from the chord p0-p1
+        chord = [p1[0] - p0[0], p1[1] - p0[1]]
+        chord_length = (chord[0] ** 2 + chord[1] ** 2) ** 0.5
+        if chord_length == 0:
+            deviation = ((p_mid[0] - p0[0]) ** 2 + (p_mid[1] - p0[1]) ** 2) ** 0.5
+        else:
+            deviation = (
+                abs(chord[0] * (p_mid[1] - p0[1]) - chord[1] * (p_mid[0] - p0[0]))
+                / chord_length
+            )
+        if depth == 0 or deviation <= tolerance:
+            return [p1]
+        return refine(u0, u_mid, p0, p_mid, depth - 1) + refine(
+            u_mid, u1, p_mid, p1, depth - 1
+        )
+
+    first_point = curve.evaluate_single(u_start)
+    last_point = curve.evaluate_single(u_end)
+    return [first_point] + refine(u_start, u_end, first_point, last_point, max_depth)
+
+
+def build_nurbs_hull(tolerance: float = 1e-3) -> list[list[float]]:
+    """Define a closed NURBS hull and sample points along it.
+
+    Args:
+        tolerance (float): chord deviation tolerance of the adaptive sampling
+
+    Returns:
+        list[list[float]]: points evaluated along the curve
+    """
+    curve = NURBS.Curve()
+    curve.degree = 3
+    curve.ctrlpts = [
+        [0.0, 2.0],  # Control points
+        [2.0, 3.0],
+        [4.0, 2.0],
+        [3.0, -2.0],
+        [1.0, -2.0],
+        [-1.0, 0.0],  # Close the curve by duplicating the starting control point
+        [0.0, 2.0],
+    ]
+    curve.knotvector = [0, 0, 0, 0, 1, 2, 3, 4, 4, 4, 4]  # Closed curve knot vector
+
+    # Evaluate points on the curve, concentrating them where it bends
+    u_start, u_end = curve.knotvector[curve.degree], curve.knotvector[-curve.degree - 1]
+    return sample_curve_adaptively(
+        curve, u_start=u_start, u_end=u_end, tolerance=tolerance
+    )
+
+
+def demo_interactive():
+    """Equilibrium points of a hull drawn with the mouse."""
+    target_area = 1.0  # Set the desired submerged area
+    input_curve_points = get_mouse_clicks(
+        "Draw polygon by clicking on vertices and \n double click at center of gravity to finish."
+    )
+    center_of_gravity = input_curve_points.pop()
+    # Duplicated first point in last position to get a polygon
+    input_curve_points = close_curve(input_curve_points)
+
+    find_equilibrium_points(
+        curve_points=input_curve_points,
+        center_of_gravity=center_of_gravity,
+        target_area=target_area,
+        plot=True,
+    )
+
+
+if __name__ == "__main__":
+    demo_circular_boat()
+    demo_catamaran()
+    build_nurbs_hull()
+    demo_interactive()
@@ -1,13 +1,39 @@
+import matplotlib
 import matplotlib.pyplot as plt
 
+# Fallback polygon (2x2 square, area 4) and center of gravity returned when
+# no interactive backend is available to capture clicks. The square is kept
+# comfortably larger than the demo target areas: at 100% displacement the
+# rotated hull area dips fractionally below the target through floating-point
+# rotation error and the draft solver reports the ship as sinking
+DEFAULT_CLICKED_POINTS = [
+    (-1.0, -1.0),
+    (1.0, -1.0),
+    (1.0, 1.0),
+    (-1.0, 1.0),
+    (0.0, 0.0),
+]
+
+# Backends that render off-screen: plt.show() returns immediately there,
+# so waiting for clicks would silently produce an empty polygon
+NON_INTERACTIVE_BACKENDS = {"agg", "pdf", "svg", "ps", "cairo", "template"}
+
 
 def get_mouse_clicks(title):
     """
     Capture mouse click positions on a matplotlib figure, ending on a double-click.
 
+    On a non-interactive backend (e.g. during automated sweeps or headless
+    runs) no window can be opened; a default unit square and center of
+    gravity are returned instead of blocking.
+
     Returns:
         list of tuples: A list of (x, y) coordinates of clicked points.
     """
+    if matplotlib.get_backend().lower() in NON_INTERACTIVE_BACKENDS:
+        print("Non-interactive backend detected. Using default polygon.")
+        return list(DEFAULT_CLICKED_POINTS)
+
     clicked_points = []
 
     def onclick(event):
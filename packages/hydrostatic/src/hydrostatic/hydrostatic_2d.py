@@ -3,19 +3,47 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import numpy as np
-from scipy.optimize import bisect
+from scipy.optimize import brentq
 import matplotlib.pyplot as plt
 
+try:
+    # Optional JIT acceleration of the numeric kernels (install with the
+    # "jit" extra); the module behaves identically without numba
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
 
 def close_curve(curve_points: list[list[float]]) -> list[list[float]]:
     """
     Ensure to close curve in order to get a polygon
+
+    Called once at the boundary of a pipeline: the downstream kernels work
+    on whatever chain they are given (the tests rely on open chains staying
+    open), and shifting or rotating a closed curve keeps it closed, so no
+    inner loop ever re-closes or re-copies the polygon.
+
     Args:
-        curve_points (list[list[float]]): Curve which is already close or not
+        curve_points (list[list[float]] | np.ndarray): Curve which is already close or not
 
     Returns:
-        list[list[float]]: The closed curve (polygon)
+        list[list[float]] | np.ndarray: The closed curve (polygon)
     """
+    if isinstance(curve_points, np.ndarray):
+        if len(curve_points) > 0 and not np.array_equal(
+            curve_points[0], curve_points[-1]
+        ):
+            curve_points = np.vstack([curve_points, curve_points[:1]])
+        return curve_points
     if curve_points:
         if curve_points[0] == curve_points[-1]:
             pass
@@ -30,6 +58,12 @@ def compute_submerged_points_and_segments(
     """
     Compute the submerged points below y=0 of a polygon chain and flotation segments
 
+    Thin wrapper over the vectorized SoA clipping kernel
+    (_submerged_points_soa): it splits the input into separate coordinate
+    arrays and packages the flotation points into segment pairs. The tuple
+    list is only materialized at this public boundary; the hot paths
+    (_submerged_properties_soa) consume the raw flotation ndarray directly.
+
     Args:
         curve_points (list[list[float]]): List of points defining the curve (first point must be repeated in last position for polygon).
 
@@ -38,47 +72,100 @@ def compute_submerged_points_and_segments(
         - Arrays of x and y coordinates of submerged points.
         - List of tuples representing segments describing flotation (pairs of x-coordinates on the line y=0).
     """
-    below_points = []
-    flotation_points = []
+    # float64 on purpose: the shoelace sums and the waterline crossing
+    # interpolation feed exact-equality checks (area == target at the root,
+    # points exactly on y=0) that float32 rounding would break
+    points = np.asarray(curve_points, dtype=float)
+    if points.size == 0:
+        return np.array([]), np.array([]), []
+
+    # Structure-of-arrays layout: work on separate contiguous x and y
+    # arrays rather than interleaved (n, 2) rows
+    x_points = np.ascontiguousarray(points[:, 0])
+    y_points = np.ascontiguousarray(points[:, 1])
+    x, y, flotation_points = _submerged_points_soa(x_points, y_points)
+
+    n_pairs = len(flotation_points) // 2
+    x_flotations = [
+        (flotation_points[2 * i], flotation_points[2 * i + 1]) for i in range(n_pairs)
+    ]
 
-    for i in range(len(curve_points) - 1):
-        p1, p2 = curve_points[i], curve_points[i + 1]
+    if len(x) == 0:
+        return np.array([]), np.array([]), x_flotations
+    return x, y, x_flotations
 
-        # Add submerged point if below the waterline
-        if p1[1] <= 0:
-            below_points.append(p1)
-        if p1[1] == 0:
-            flotation_points.append(p1[0])
 
-        # Check for intersection with the waterline
-        if (p1[1] < 0 < p2[1]) or (p2[1] < 0 < p1[1]):
-            t = -p1[1] / (
-                p2[1] - p1[1]
-            )  # Linear interpolation to find intersection with y=0
-            intersect = [p1[0] + t * (p2[0] - p1[0]), 0.0]
-            below_points.append(intersect)
-            flotation_points.append(intersect[0])
+@njit(cache=True)
+def _submerged_points_soa(
+    x_points: np.ndarray, y_points: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Kernel of the waterline clipping, operating on separate x and y arrays.
+    Compiled with numba when available, identical as plain NumPy otherwise.
 
-    # Add last point if it’s below the waterline
-    if curve_points:
-        if curve_points[-1][1] <= 0:
-            below_points.append(curve_points[-1])
-        if curve_points[-1][1] == 0:
-            flotation_points.append(curve_points[-1][0])
+    This is a vectorized Sutherland–Hodgman clip against the single half
+    plane y <= 0: kept vertices and edge/waterline intersections are
+    classified with boolean masks and scattered to their output positions,
+    with no per-edge Python loop.
 
-    flotation_points = np.sort(flotation_points)
-    x_flotations = [
-        (flotation_points[2 * i], flotation_points[2 * i + 1])
-        for i in range(int(len(flotation_points) / 2))
-    ]
+    Args:
+        x_points (np.ndarray): x-coordinates of the curve vertices
+        y_points (np.ndarray): y-coordinates of the curve vertices
 
-    # Convert the list of points to numpy arrays
-    if len(below_points) == 0:
-        return np.array([]), np.array([]), x_flotations
-    else:
-        below_points = np.array(below_points)
-        x, y = below_points[:, 0], below_points[:, 1]
-        return x, y, x_flotations
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        - Arrays of x and y coordinates of submerged points in traversal order.
+        - Sorted x-coordinates of the flotation points (pairs form segments).
+    """
+    # Fast paths: a hull strictly above the waterline has nothing submerged
+    # and one strictly below is kept whole; neither has any crossing or
+    # flotation point, so the interpolation and scatter work is skipped
+    if y_points.min() > 0:
+        return np.empty(0), np.empty(0), np.empty(0)
+    if y_points.max() < 0:
+        return x_points, y_points, np.empty(0)
+
+    # Vertices on or below the waterline are kept in traversal order
+    below_mask = y_points <= 0
+
+    # Edges crossing the waterline strictly (one endpoint above, one below):
+    # the sign product is -1 exactly for strictly opposite endpoints, so one
+    # predicate replaces the four comparisons and two boolean combines of
+    # (y1 < 0 < y2) | (y2 < 0 < y1), and endpoints on y=0 stay excluded
+    y1, y2 = y_points[:-1], y_points[1:]
+    crossing_mask = np.sign(y1) * np.sign(y2) < 0
+    # Linear interpolation to find intersections with y=0
+    t = -y1[crossing_mask] / (y2[crossing_mask] - y1[crossing_mask])
+    x_crossings = x_points[:-1][crossing_mask] + t * np.diff(x_points)[crossing_mask]
+
+    # Interleave vertices and intersections in traversal order by scattering
+    # them into a preallocated buffer at their final positions (a counting
+    # sort: cheaper than argsort and without any incremental list growth).
+    # Vertex i lands after the kept vertices and crossings preceding it; the
+    # crossing on edge i lands right after vertex i.
+    below_idx = np.nonzero(below_mask)[0]
+    cross_idx = np.nonzero(crossing_mask)[0]
+    below_count = below_mask.astype(np.intp)
+    kept_before_vertex = np.cumsum(below_count) - below_count
+    crossings_before_edge = np.zeros(len(x_points), dtype=np.intp)
+    crossings_before_edge[1:] = np.cumsum(crossing_mask.astype(np.intp))
+
+    vertex_positions = kept_before_vertex[below_idx] + crossings_before_edge[below_idx]
+    crossing_positions = (
+        kept_before_vertex[cross_idx]
+        + below_count[cross_idx]
+        + crossings_before_edge[cross_idx]
+    )
+    x = np.empty(len(below_idx) + len(cross_idx))
+    y = np.empty_like(x)
+    x[vertex_positions] = x_points[below_idx]
+    y[vertex_positions] = y_points[below_idx]
+    x[crossing_positions] = x_crossings
+    y[crossing_positions] = 0.0
+
+    # Flotation points: vertices lying exactly on y=0 plus waterline intersections
+    flotation_points = np.sort(np.concatenate((x_points[y_points == 0], x_crossings)))
+    return x, y, flotation_points
 
 
 def compute_flotation_segments_inertia(
@@ -97,12 +184,15 @@ def compute_flotation_segments_inertia(
         float: inertia of the flotation at center of rotation [unit**2]
     """
 
-    inertia = 0
-    for xs in x_flotations:
-        inertia += np.abs((xs[0] - x_center) ** 3 / 3 - (xs[1] - x_center) ** 3 / 3)
-    return inertia
+    # One reduction over all segments instead of a Python loop over tuples
+    pairs = np.asarray(x_flotations, dtype=float).reshape(-1, 2)
+    return float(
+        np.sum(np.abs((pairs[:, 0] - x_center) ** 3 - (pairs[:, 1] - x_center) ** 3))
+        / 3
+    )
 
 
+@njit(cache=True)
 def compute_area_and_centroid(
     x: np.ndarray, y: np.ndarray
 ) -> tuple[float, float, float]:
@@ -110,37 +200,41 @@ def compute_area_and_centroid(
     Compute the submerged area and centroid using the shoelace formula.
     https://en.wikipedia.org/wiki/Shoelace_formula
 
+    Compiled with numba when available (hot kernel of the draft bisection).
+    Dispatch is left lazy on purpose: numba specializes the kernel per input
+    dtype at runtime, and the pipeline always feeds float64 arrays so only a
+    single specialization is ever generated and cached on disk.
+
+    The area is signed (positive for counter-clockwise traversal); callers
+    needing a magnitude take abs() themselves, keeping the orientation
+    information available downstream. Apart from the degenerate guards
+    (empty, single point, zero area) the computation is a straight
+    branch-free sequence of vectorized operations on the coordinate arrays.
 
     Args:
         x (np.ndarray): x-coordinates (horizontal) of the submerged curve.
         y (np.ndarray): y-coordinates (vertical up) of the submerged curve.
 
     Returns:
-        Tuple[float, float, float]: Area, x-coordinate of centroid, and y-coordinate of centroid.
+        Tuple[float, float, float]: Signed area, x-coordinate of centroid, and y-coordinate of centroid.
     """
     if len(x) == 0:
-        area = 0
-        cx = np.nan
-        cy = np.nan
-    elif len(x) == 1:
-        area = 0
-        cx = x[0]
-        cy = y[0]
-    else:
-        area = 0.5 * np.sum(x[:-1] * y[1:] - x[1:] * y[:-1])
-        if area == 0:
-            # Take the lowest point for continuity with the solid ground case
-            i_bottom = np.argmin(y)
-            cx = x[i_bottom]
-            cy = y[i_bottom]
-        else:
-            cx = (1 / (6 * area)) * np.sum(
-                (x[:-1] + x[1:]) * (x[:-1] * y[1:] - x[1:] * y[:-1])
-            )
-            cy = (1 / (6 * area)) * np.sum(
-                (y[:-1] + y[1:]) * (x[:-1] * y[1:] - x[1:] * y[:-1])
-            )
-    return abs(area), cx, cy
+        return 0.0, np.nan, np.nan
+    if len(x) == 1:
+        return 0.0, float(x[0]), float(y[0])
+    # Shared cross term of the shoelace formula, computed once for the
+    # area and both centroid coordinates
+    cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+    area = 0.5 * np.sum(cross)
+    if area == 0:
+        # Take the lowest point for continuity with the solid ground case.
+        # This scan only runs in the degenerate zero-area branch, so the
+        # common path pays nothing for it
+        i_bottom = np.argmin(y)
+        return 0.0, float(x[i_bottom]), float(y[i_bottom])
+    cx = (1 / (6 * area)) * np.sum((x[:-1] + x[1:]) * cross)
+    cy = (1 / (6 * area)) * np.sum((y[:-1] + y[1:]) * cross)
+    return area, cx, cy
 
 
 def compute_submerged_area_and_centroid(
@@ -149,20 +243,53 @@ def compute_submerged_area_and_centroid(
     """
     Compute the submerged area and centroid for a given curve below y=0.
 
+    Hulls entirely above or below the waterline are detected from their y
+    extrema inside the clipping kernel and bypass the crossing work.
+
     Args:
         curve_points (list[list[float]]): list of points defining the curve.
 
     Returns:
         Tuple[float, float, float]: Area, x-coordinate of centroid, and y-coordinate of centroid.
     """
-    x, y, x_flotations = compute_submerged_points_and_segments(curve_points)
+    # AoS boundary: split the rows once, then stay on coordinate arrays
+    points = np.asarray(curve_points, dtype=float)
+    if points.size == 0:
+        return 0.0, np.nan, np.nan, 0
+    return _submerged_properties_soa(
+        np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1])
+    )
+
+
+def _submerged_properties_soa(
+    x_points: np.ndarray, y_points: np.ndarray
+) -> tuple[float, float, float, float]:
+    """
+    Submerged area, centroid and metacentric radius from SoA coordinate buffers
 
-    area, cx, cy = compute_area_and_centroid(x, y)
+    Fused path for callers that already hold separate x and y arrays: runs
+    the clipping kernel and the shoelace directly, without materializing the
+    flotation segment tuples.
+
+    Args:
+        x_points (np.ndarray): x-coordinates of the (closed) curve vertices
+        y_points (np.ndarray): y-coordinates of the (closed) curve vertices
+
+    Returns:
+        Tuple[float, float, float, float]: Area, centroid coordinates, and metacentric radius.
+    """
+    x, y, flotation_points = _submerged_points_soa(x_points, y_points)
+
+    signed_area, cx, cy = compute_area_and_centroid(x, y)
+    area = abs(signed_area)
     if area > 0:
-        metacentric_radius = (
-            compute_flotation_segments_inertia(x_flotations=x_flotations, x_center=cx)
-            / area
+        # Inertia of the flotation segments around the centroid, computed on
+        # the raw pairs of sorted flotation x-coordinates
+        pairs = flotation_points[: 2 * (len(flotation_points) // 2)].reshape(-1, 2)
+        inertia = np.sum(
+            np.abs((pairs[:, 0] - cx) ** 3 / 3 - (pairs[:, 1] - cx) ** 3 / 3)
         )
+        metacentric_radius = inertia / area
     else:
         metacentric_radius = 0
     return area, cx, cy, metacentric_radius
@@ -182,49 +309,113 @@ def area_difference(
     Returns:
         float: Difference between computed area and target area.
     """
-    # Shift curve points by draft_offset
-    shifted_points = [[p[0], p[1] - draft_offset] for p in curve_points]
+    # Shift curve points by draft_offset (single vectorized subtraction)
+    points = np.asarray(curve_points, dtype=float)
+    shifted_points = points - (0.0, draft_offset)
     # Compute the area below y=0 for the shifted curve
     area, _, _, _ = compute_submerged_area_and_centroid(shifted_points)
     return area - target_area
 
 
 def find_draft_offset_at_vertical_equilibrium(
-    target_displacement_area, curve_points: list[list[float]]
+    target_displacement_area,
+    curve_points: list[list[float]],
+    initial_guess: float | None = None,
+    tolerance_area: float | None = None,
 ) -> float:
     """
     Find the vertical offset to get the draft which enables to get the displacement of the ship
 
+    The root is bracketed between the two adjacent vertex y levels enclosing
+    the target area, so no padding of the search interval is needed. When an
+    initial guess is supplied (e.g. the previous angle of a sweep), a small
+    bracket grown around it replaces the vertex-level scan.
+
     Args:
         target_displacement_area (float): The target displacement (area in 2D)
         curve_points (List[List[float]]: The points describing the 2D ship
+        initial_guess (float): optional starting draft offset near the
+            expected root, used to warm-start the bracketing
+        tolerance_area (float): optional acceptable error on the submerged
+            area; converted to a draft tolerance through the hull width
+            (the Lipschitz constant of area with respect to draft) so the
+            solver stops as soon as the area budget is met
 
     Returns:
         float: The vertical offset (positive to move geometry down, and increase draft and displacement)
     """
-    y_min = min([p[1] for p in curve_points])
-    y_max = max([p[1] for p in curve_points])
-
-    draft_offset_min, draft_offset_max = (
-        y_min - 10,
-        y_max + 10,
-    )  # Adjust bounds as needed
-    try:
-        draft_offset_equilibrium: float = bisect(
-            area_difference,
-            draft_offset_min,
-            draft_offset_max,
-            args=(
-                target_displacement_area,
-                curve_points,
-            ),
-        )
-    except ValueError as e:
-        if str(e) == "f(a) and f(b) must have different signs":
-            raise ValueError("Ship is sinking")
+    # Convert once to a contiguous float64 array so every solver iteration
+    # reuses the same buffer instead of rebuilding lists of lists
+    curve_points = np.ascontiguousarray(curve_points, dtype=float)
+
+    # Fused solver driver on SoA buffers: shift y in place, clip, shoelace.
+    # The centroid and metacentric bookkeeping of the full pipeline is not
+    # needed while iterating on the area only. The curve is closed once by
+    # the caller and the vertical shift preserves that closure, so no
+    # iteration ever re-runs close_curve
+    x_points = np.ascontiguousarray(curve_points[:, 0])
+    y_points = np.ascontiguousarray(curve_points[:, 1])
+    shifted_y = np.empty_like(y_points)
+
+    def area_difference_shifted(draft_offset: float) -> float:
+        np.subtract(y_points, draft_offset, out=shifted_y)
+        x, y, _ = _submerged_points_soa(x_points, shifted_y)
+        signed_area, _, _ = compute_area_and_centroid(x, y)
+        return abs(signed_area) - target_displacement_area
+
+    # The submerged area is monotone in the draft offset and smooth between
+    # consecutive vertex levels, so bracket the root between two adjacent
+    # sorted vertex y values instead of scanning a padded ±10 interval
+    y_levels = np.unique(curve_points[:, 1])
+    if area_difference_shifted(y_levels[-1]) < 0:
+        # Even with the whole hull submerged the target is not reached
+        raise ValueError("Ship is sinking")
+
+    # The area changes by at most the hull width per unit of draft, so an
+    # area budget translates into a draft tolerance through that width;
+    # without a budget the scipy default (2e-12) applies
+    xtol = 2e-12
+    if tolerance_area is not None:
+        hull_width = x_points.max() - x_points.min()
+        if hull_width > 0:
+            xtol = max(tolerance_area / hull_width, xtol)
+
+    if initial_guess is not None and len(y_levels) > 1:
+        # Warm start: grow a small bracket around the guess. The area
+        # difference is monotone and has the right signs at the extreme
+        # vertex levels, so the clamped expansion always brackets the root
+        step = 0.05 * (y_levels[-1] - y_levels[0])
+        guess = min(max(initial_guess, y_levels[0]), y_levels[-1])
+        bracket_low = max(guess - step, y_levels[0])
+        bracket_high = min(guess + step, y_levels[-1])
+        f_low = area_difference_shifted(bracket_low)
+        f_high = area_difference_shifted(bracket_high)
+        while f_low > 0 or f_high < 0:
+            step *= 2
+            if f_low > 0:
+                bracket_low = max(bracket_low - step, y_levels[0])
+                f_low = area_difference_shifted(bracket_low)
+            if f_high < 0:
+                bracket_high = min(bracket_high + step, y_levels[-1])
+                f_high = area_difference_shifted(bracket_high)
+        return brentq(area_difference_shifted, bracket_low, bracket_high, xtol=xtol)
+
+    low, high = 0, len(y_levels) - 1
+    while high - low > 1:
+        mid = (low + high) // 2
+        if area_difference_shifted(y_levels[mid]) < 0:
+            low = mid
         else:
-            # Reraise error otherwise
-            raise ValueError(repr(e))
+            high = mid
+
+    # Brent's method converges superlinearly on the bracketed smooth piece,
+    # where plain bisection needs ~50 iterations
+    draft_offset_equilibrium: float = brentq(
+        area_difference_shifted,
+        y_levels[low],
+        y_levels[high],
+        xtol=xtol,
+    )
 
     return draft_offset_equilibrium
 
@@ -234,6 +425,7 @@ def compute_righting_arm(
     target_area: float,
     center_of_gravity: list[float],
     plot: bool = False,
+    draft_offset: float | None = None,
 ) -> float:
     """
     Compute the righting arm GZ
@@ -243,21 +435,29 @@ def compute_righting_arm(
         target_area (float): target submerged area [m²]
         center_of_gravity (list[float]): coordinate of center of gravity[m]
         plot (bool): if at True, plot debug graph
+        draft_offset (float): optional precomputed equilibrium draft offset;
+            when given the vertical equilibrium solve is skipped entirely
+            (used by the angle sweep, which solves each draft itself with a
+            warm start from the previous angle)
 
     Returns:
         float: the righting arm GZ [m]
         float: the metacentric height [m]
     """
-    draft_offset_equilibrium = find_draft_offset_at_vertical_equilibrium(
-        target_displacement_area=target_area, curve_points=curve_points
-    )
-
-    # Apply the found draft_offset to compute the submerged area and centroid
-    shifted_points = [[p[0], p[1] - draft_offset_equilibrium] for p in curve_points]
-    area, cx, cy, metacentric_radius = compute_submerged_area_and_centroid(
-        shifted_points
+    curve_points = np.ascontiguousarray(curve_points, dtype=float)
+    if draft_offset is None:
+        draft_offset = find_draft_offset_at_vertical_equilibrium(
+            target_displacement_area=target_area, curve_points=curve_points
+        )
+    draft_offset_equilibrium = draft_offset
+
+    # Apply the found draft_offset to compute the submerged area and centroid,
+    # staying on separate coordinate arrays
+    shifted_points = curve_points - (0.0, draft_offset_equilibrium)
+    area, cx, cy, metacentric_radius = _submerged_properties_soa(
+        np.ascontiguousarray(shifted_points[:, 0]),
+        np.ascontiguousarray(shifted_points[:, 1]),
     )
-    _, _, segments = compute_submerged_points_and_segments(shifted_points)
     righting_arm = (
         center_of_gravity[0] - cx
     )  # Sign convention chosen to have positive slope when stable
@@ -271,8 +471,12 @@ def compute_righting_arm(
         print(f"Submerged Area (Volume): {area}")
         print(f"Center of buoyancy: ({cx}, {cy})")
 
+        # The flotation segments are only drawn here, so the second clip
+        # that materializes them is not paid on the non-plotting path
+        _, _, segments = compute_submerged_points_and_segments(shifted_points)
+
         # (Optional) Plot the curve and submerged region
-        curve_x, curve_y = zip(*shifted_points)
+        curve_x, curve_y = shifted_points[:, 0], shifted_points[:, 1]
         plt.fill(curve_x, curve_y, color="red", alpha=0.1, edgecolor="black")
         plt.plot(curve_x, curve_y, color="black", label="Closed curve")
         plt.plot(cx, cy, marker="o", label="Center of buoyancy")
@@ -319,21 +523,48 @@ def compute_righting_arm(
     return righting_arm, metacentric_height
 
 
-def rotate(points: list[list[float]], angle) -> list[list[float]]:
+def _rotation_matrices(angles_rad: np.ndarray) -> np.ndarray:
+    """
+    Build the stack of direct 2D rotation matrices for a full angle sweep
+
+    The sin/cos tables are evaluated once for all angles instead of once per
+    call to rotate().
+
+    Args:
+        angles_rad (np.ndarray): angles of rotation [rad]
+
+    Returns:
+        np.ndarray: (len(angles_rad), 2, 2) stack of rotation matrices
+    """
+    cos_angles, sin_angles = np.cos(angles_rad), np.sin(angles_rad)
+    rotation_matrices = np.empty((len(angles_rad), 2, 2))
+    rotation_matrices[:, 0, 0] = cos_angles
+    rotation_matrices[:, 0, 1] = -sin_angles
+    rotation_matrices[:, 1, 0] = sin_angles
+    rotation_matrices[:, 1, 1] = cos_angles
+    return rotation_matrices
+
+
+def rotate(
+    points: list[list[float]], angle, out: np.ndarray | None = None
+) -> np.ndarray:
     """
     Rotate list of 2D points by angle (direct rotation)
 
     Args:
-        points (list[list[float]]): list of coordinates of points describing the 2D hull [m]
+        points (list[list[float]] | np.ndarray): list of coordinates of points describing the 2D hull [m]
         angle (float): angle of rotation [rad]
+        out (np.ndarray): optional preallocated (n, 2) buffer receiving the
+            result, for callers rotating repeatedly without reallocating
 
     Returns:
-        (list[list[float]]): list of coordinates of points describing the 2D hull rotated around [0,0] [m]
+        (np.ndarray): coordinates of points describing the 2D hull rotated around [0,0], shape (n, 2) [m]
     """
-    complex_points = [p[0] + p[1] * 1j for p in points]
-    complex_point_rotated = [c * np.exp(1j * angle) for c in complex_points]
-    rotated_points = [(c.real, c.imag) for c in complex_point_rotated]
-    return rotated_points
+    points = np.asarray(points, dtype=float)
+    cos_angle, sin_angle = np.cos(angle), np.sin(angle)
+    rotation_matrix = np.array([[cos_angle, -sin_angle], [sin_angle, cos_angle]])
+    # (n, 2) @ (2, 2): one matmul, result handed over as an ndarray
+    return np.matmul(points, rotation_matrix.T, out=out)
 
 
 def compute_righting_arm_curve(
@@ -344,29 +575,59 @@ def compute_righting_arm_curve(
     plot: bool = False,
 ):
     """
+    Compute the righting arm GZ for a sweep of heel angles
+
+    All hull and center of gravity rotations are evaluated in one batched
+    tensor operation; only the draft equilibrium solve remains per angle,
+    as each angle needs its own root search. That loop is kept serial on
+    purpose: the per-angle solve spends its time in Python/scipy where
+    threads serialize on the GIL, and process pools cost more to spawn
+    than the whole sweep takes.
 
     Args:
-        angles_deg:
+        curve_points (list[list[float]]): list of coordinates of points describing the 2D hull [m]
+        center_of_gravity (list[float]): coordinate of center of gravity [m]
+        target_area (float): target submerged area [m²]
+        angles_deg (list[float]): angles of rotation to evaluate [deg]
+        plot (bool): if at True, plot the GZ curve
 
     Returns:
-
+        list[float]: the righting arm GZ for each angle [m]
     """
-    righting_arms = []  # List of GZs
-    for angle_deg in angles_deg:
-        rotated_curve_points = rotate(points=curve_points, angle=np.deg2rad(angle_deg))
-        rotated_center_of_gravity = rotate(
-            points=[center_of_gravity], angle=np.deg2rad(angle_deg)
-        )[0]
+    points = np.ascontiguousarray(curve_points, dtype=float)
+    cog = np.asarray(center_of_gravity, dtype=float)
 
-        # Step 2: find draft_offset using bisection to match the target_area
+    # Batch all rotations in one tensor operation: an (A, 2, 2) stack of
+    # rotation matrices applied to the hull and center of gravity at once,
+    # producing the (A, n, 2) tensor of all rotated hulls in a single einsum
+    angles_rad = np.deg2rad(angles_deg)
+    rotation_matrices = _rotation_matrices(angles_rad)
+    rotated_curves = np.einsum("aij,nj->ani", rotation_matrices, points)
+    rotated_centers_of_gravity = rotation_matrices @ cog
 
+    righting_arms = []  # List of GZs
+    # Warm start the draft solve of each angle with the solution of the
+    # previous one: consecutive heel angles have nearly identical drafts,
+    # so the solver starts from a tight bracket instead of a full scan
+    draft_offset_guess = None
+    for rotated_curve_points, rotated_center_of_gravity in zip(
+        rotated_curves, rotated_centers_of_gravity
+    ):
+        # Find draft_offset to match the target_area
+        draft_offset = find_draft_offset_at_vertical_equilibrium(
+            target_displacement_area=target_area,
+            curve_points=rotated_curve_points,
+            initial_guess=draft_offset_guess,
+        )
         righting_arm, metacentric_radius = compute_righting_arm(
             curve_points=rotated_curve_points,
             target_area=target_area,
             center_of_gravity=rotated_center_of_gravity,
             plot=False,
+            draft_offset=draft_offset,
         )
         righting_arms.append(righting_arm)
+        draft_offset_guess = draft_offset
 
     if plot:
         plt.title("GZ curve")
@@ -383,6 +644,7 @@ def find_equilibrium_points(
     center_of_gravity: list[float],
     target_area: float,
     plot=False,
+    angle_step_deg: float = 1.0,
 ) -> float:
     """
     Find the different equilibrium points (both heel and vertical equilibrium)
@@ -391,11 +653,18 @@ def find_equilibrium_points(
         curve_points(list[list[float]]: list of coordinates of 2D points
         center_of_gravity (list[float]): 2D coordinates of center of gravity
         target_area (float): target submerged area
+        angle_step_deg (float): step of the scanning grid [deg]. The
+            bracketing solver refines each sign change to full accuracy, so
+            a coarser grid only risks missing equilibria narrower than the
+            step, not losing precision on the ones it finds.
 
     Returns:
         list[float]: angles of equilibrium points [deg]
     """
-    angles_deg = range(-180, 182)  # enlarge a bit
+    # Single ndarray for the whole sweep, handed in one batch to the
+    # vectorized rotation in compute_righting_arm_curve (enlarged a bit
+    # past 180° so the wrap-around sign change is caught)
+    angles_deg = np.arange(-180, 180 + 2 * angle_step_deg, angle_step_deg, dtype=float)
 
     righting_arm_curves = compute_righting_arm_curve(
         curve_points=curve_points,
@@ -405,6 +674,11 @@ def find_equilibrium_points(
         plot=plot,
     )
 
+    # Seed the memo with the sweep already computed above: the root finder
+    # starts from grid angles, so neither their hull rotation nor their
+    # draft solve is ever repeated; only genuinely new angles pay for both
+    righting_arm_memo = dict(zip(angles_deg, righting_arm_curves))
+
     # Define a function wrapper to be able to find root
     def f(angle_deg: float) -> float:
         """
@@ -416,19 +690,20 @@ def find_equilibrium_points(
         Returns:
             float: GZ [m]
         """
-        righting_arm = compute_righting_arm_curve(
-            curve_points=curve_points,
-            angles_deg=[angle_deg],
-            center_of_gravity=center_of_gravity,
-            target_area=target_area,
-            plot=False,
-        )[0]
-        return righting_arm
+        if angle_deg not in righting_arm_memo:
+            righting_arm_memo[angle_deg] = compute_righting_arm_curve(
+                curve_points=curve_points,
+                angles_deg=[angle_deg],
+                center_of_gravity=center_of_gravity,
+                target_area=target_area,
+                plot=False,
+            )[0]
+        return righting_arm_memo[angle_deg]
 
     # Based on https://stackoverflow.com/questions/72333164/find-all-roots-of-an-arbitrary-interpolated-function-in-a-given-interval
 
     # Evaluate the function at several points with the sufficient accuracy
-    f_p = np.array(righting_arm_curves)
+    f_p = np.asarray(righting_arm_curves)
     # Find the discrete points where sign is changing
     (indices,) = np.nonzero(f_p[:-1] * f_p[1:] <= 0)
 
@@ -437,23 +712,30 @@ def find_equilibrium_points(
     for i in range(indices.shape[0]):
         guess_min = angles_deg[indices[i]]
         guess_max = angles_deg[indices[i] + 1]
+        # A grid angle that is already an exact zero of the computed curve
+        # needs no refinement solve at all
+        if f_p[indices[i]] == 0:
+            equilibrium_angles_deg.append(guess_min)
+            continue
+        if f_p[indices[i] + 1] == 0:
+            equilibrium_angles_deg.append(guess_max)
+            continue
         if guess_min > guess_max:
             guess_min, guess_max = guess_max, guess_min
-        equilibrium_angle_deg = bisect(f, a=guess_min, b=guess_max)
+        equilibrium_angle_deg = brentq(f, a=guess_min, b=guess_max)
         equilibrium_angles_deg.append(equilibrium_angle_deg)
 
-    # Filter to avoid duplicate
-    equilibrium_angles_deg = mod_minus_180_180(
-        unique_angles_deg(equilibrium_angles_deg)
+    # Filter to avoid duplicate, and report the angles in increasing order
+    equilibrium_angles_deg = np.sort(
+        mod_minus_180_180(unique_angles_deg(equilibrium_angles_deg))
     )
     if plot:
         for equilibrium_angle_deg in equilibrium_angles_deg:
+            equilibrium_angle_rad = np.deg2rad(equilibrium_angle_deg)
             compute_righting_arm(
-                curve_points=rotate(curve_points, np.deg2rad(equilibrium_angle_deg)),
+                curve_points=rotate(curve_points, equilibrium_angle_rad),
                 target_area=target_area,
-                center_of_gravity=rotate(
-                    [center_of_gravity], np.deg2rad(equilibrium_angle_deg)
-                )[0],
+                center_of_gravity=rotate([center_of_gravity], equilibrium_angle_rad)[0],
                 plot=True,
             )
     return equilibrium_angles_deg
@@ -470,29 +752,30 @@ def unique_angles_deg(angles_deg: list[float], decimal: float = 1) -> list[float
     Returns:
         list[float]: the list of float with suppressed angles
     """
-    unique_angles_deg_list = []
     tolerance = 10 ** (-decimal)
 
-    for angle_deg in angles_deg:
-        # Normalize the angle to the range [0, 360) for better comparison
-        normalized_angle_deg = angle_deg % 360
-
-        # Check if the angle is within tolerance of any already added angle
-        is_unique = True
-        for existing_angle in unique_angles_deg_list:
-            # Check if the difference between angles is less than the tolerance
-            if (
-                abs(normalized_angle_deg - existing_angle) < tolerance
-                or abs(360 - abs(normalized_angle_deg - existing_angle)) < tolerance
-            ):
-                is_unique = False
-                break
-
-        # If unique, add to the list
-        if is_unique:
-            unique_angles_deg_list.append(normalized_angle_deg)
-
-    return np.round(unique_angles_deg_list, decimals=decimal)
+    # Normalize the angles to the range [0, 360) for better comparison
+    normalized_angles_deg = np.asarray(angles_deg, dtype=float) % 360
+    if normalized_angles_deg.size == 0:
+        return np.round(normalized_angles_deg, decimals=decimal)
+
+    # Sort once and keep the first angle of each cluster: an angle is a
+    # duplicate when its gap to the previous sorted angle is below tolerance
+    # (O(K log K) instead of comparing every pair)
+    sorted_angles_deg = np.sort(normalized_angles_deg)
+    keep = np.empty(len(sorted_angles_deg), dtype=bool)
+    keep[0] = True
+    keep[1:] = np.diff(sorted_angles_deg) >= tolerance
+    kept_angles_deg = sorted_angles_deg[keep]
+
+    # The range wraps around: the last cluster may continue into the first
+    if (
+        len(kept_angles_deg) > 1
+        and 360 - (kept_angles_deg[-1] - kept_angles_deg[0]) < tolerance
+    ):
+        kept_angles_deg = kept_angles_deg[:-1]
+
+    return np.round(kept_angles_deg, decimals=decimal)
 
 
 def mod_minus_180_180(angle_deg: float):
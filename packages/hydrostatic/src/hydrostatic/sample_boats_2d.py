@@ -2,12 +2,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 
-def generate_culbuto_boat() -> tuple[list[tuple[float, float]], tuple[float, float]]:
+def generate_culbuto_boat() -> tuple[np.ndarray, np.ndarray]:
     """Generates the points of a boat with a rectangle and a semi-circle centered at the top.
 
     Returns:
-        list[tuple[float, float]:]: Coordinates of the points defining the boat's hull.
-        tuple[float, float]: Center of gravity of the boat (0,0).
+        np.ndarray: Coordinates of the points defining the boat's hull, shape (n, 2).
+        np.ndarray: Center of gravity of the boat (0,0).
     """
     width = 4  # Width of the rectangle
     height = 2  # Height of the rectangle
@@ -16,37 +16,36 @@ def generate_culbuto_boat() -> tuple[list[tuple[float, float]], tuple[float, flo
 
     # Rectangle: base of the boat
     rect_x = np.linspace(-width / 2, width / 2, 10)  # 10 points along the bottom
-    rect_bottom = [(x, -height / 2 - draft_offset) for x in rect_x]  # Y offset
-    rect_right = [
-        (width / 2, y - draft_offset) for y in np.linspace(-height / 2, height / 2, 5)
-    ]
-    rect_left = [
-        (-width / 2, y - draft_offset) for y in np.linspace(height / 2, -height / 2, 5)
-    ]
+    rect_bottom = np.column_stack(
+        [rect_x, np.full(len(rect_x), -height / 2 - draft_offset)]
+    )
+    right_y = np.linspace(-height / 2, height / 2, 5) - draft_offset
+    rect_right = np.column_stack([np.full(len(right_y), width / 2), right_y])
+    left_y = np.linspace(height / 2, -height / 2, 5) - draft_offset
+    rect_left = np.column_stack([np.full(len(left_y), -width / 2), left_y])
 
     # Semi-circle: centered at the top of the rectangle
     theta = np.linspace(0, np.pi, 10)  # 10 points for a smooth curve
-    semi_circle = [
-        (radius * np.cos(t), height / 2 + radius * np.sin(t) - draft_offset)
-        for t in theta
-    ]
+    semi_circle = np.column_stack(
+        [radius * np.cos(theta), height / 2 + radius * np.sin(theta) - draft_offset]
+    )
 
     # Merge all points
-    boat_shape = rect_bottom + rect_right + semi_circle + rect_left
+    boat_shape = np.concatenate([rect_bottom, rect_right, semi_circle, rect_left])
 
     # Center of gravity at the middle of the rectangle
-    center_of_gravity = (0, -draft_offset)
+    center_of_gravity = np.array([0.0, -draft_offset])
 
     return boat_shape, center_of_gravity
 
 
-def generate_circular_boat() -> tuple[list[tuple[float, float]], tuple[float, float]]:
+def generate_circular_boat() -> tuple[np.ndarray, np.ndarray]:
     """
     Generates the points of a boat in the shape of a circle.
 
     Returns:
-        list[tuple[float, float]:]: Coordinates of the points defining the boat's hull.
-        tuple[float, float]: Center of gravity of the boat.
+        np.ndarray: Coordinates of the points defining the boat's hull, shape (n, 2).
+        np.ndarray: Center of gravity of the boat.
     """
     radius = 2  # Radius of the circle
     num_points = 50  # Number of points to smooth the circle
@@ -54,23 +53,27 @@ def generate_circular_boat() -> tuple[list[tuple[float, float]], tuple[float, fl
 
     # Generate circle points
     theta = np.linspace(0, 2 * np.pi, num_points)
-    circle_points = [
-        (radius * np.cos(t), radius * np.sin(t) - draft_offset) for t in theta
-    ]
+    circle_points = np.column_stack(
+        [radius * np.cos(theta), radius * np.sin(theta) - draft_offset]
+    )
+    # Snap the end of the loop onto its start (sin(2*pi) is not exactly 0 in
+    # floating point) so the hull is closed by construction and close_curve
+    # can return it without copying
+    circle_points[-1] = circle_points[0]
 
     # Center of gravity at the center of the circle
-    center_of_gravity = (0, -draft_offset)
+    center_of_gravity = np.array([0.0, -draft_offset])
 
     return circle_points, center_of_gravity
 
 
-def generate_square_boat() -> tuple[list[tuple[float, float]], tuple[float, float]]:
+def generate_square_boat() -> tuple[np.ndarray, np.ndarray]:
     """
     Generates the points of a boat in the shape of a square.
 
     Returns:
-        list[tuple[float, float]:]: Coordinates of the points defining the boat's hull.
-        tuple[float, float]: Center of gravity of the boat.
+        np.ndarray: Coordinates of the points defining the boat's hull, shape (n, 2).
+        np.ndarray: Center of gravity of the boat.
     """
     width = 4  # Width of the square
     height = 2  # Height of the square
@@ -83,8 +86,10 @@ def generate_square_boat() -> tuple[list[tuple[float, float]], tuple[float, floa
     y_max = +height / 2 - draft_offset
 
     # Center of gravity at the center of the square
-    center_of_gravity = (0, -draft_offset)
-    boat_shape_square = [(x_min, y_min), (x_min, y_max), (x_max, y_max), (x_max, y_min)]
+    center_of_gravity = np.array([0.0, -draft_offset])
+    boat_shape_square = np.array(
+        [[x_min, y_min], [x_min, y_max], [x_max, y_max], [x_max, y_min]]
+    )
 
     return boat_shape_square, center_of_gravity
 
@@ -95,7 +100,7 @@ if __name__ == "__main__":
         boat_points, center_of_gravity = method()
 
         # Visualize boat shape
-        boat_x, boat_y = zip(*boat_points)
+        boat_x, boat_y = boat_points[:, 0], boat_points[:, 1]
         plt.plot(boat_x, boat_y, marker="o", linestyle="-", label="Boat Shape")
         plt.fill(boat_x, boat_y, color="gray", alpha=0.5)
 
@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[3] / "examples"
+
+
+def test_hydrostatic_2d_example_runs_headless():
+    """The example must run end to end on a non-interactive backend.
+
+    This exercises the fallback polygon of get_mouse_clicks: headless runs
+    get a default hull instead of blocking on mouse input, and that hull
+    must be large enough for the demo target areas to have an equilibrium.
+    """
+    result = subprocess.run(
+        [sys.executable, str(EXAMPLES_DIR / "hydrostatic_2d_example.py")],
+        env=dict(os.environ, MPLBACKEND="Agg"),
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
@@ -188,6 +188,20 @@ def test_compute_area_and_centroid_flat():
     )
 
 
+def test_compute_area_and_centroid_signed():
+    """The area is signed: positive for counter-clockwise traversal."""
+    # Unit square traversed counter-clockwise, then the same square reversed
+    x_ccw = np.array([0.0, 1.0, 1.0, 0.0, 0.0])
+    y_ccw = np.array([0.0, 0.0, 1.0, 1.0, 0.0])
+    area_ccw, cx_ccw, cy_ccw = compute_area_and_centroid(x=x_ccw, y=y_ccw)
+    area_cw, cx_cw, cy_cw = compute_area_and_centroid(x=x_ccw[::-1], y=y_ccw[::-1])
+    assert area_ccw == 1
+    assert area_cw == -1
+    # The centroid does not depend on the traversal direction
+    assert (cx_ccw, cy_ccw) == (0.5, 0.5)
+    assert (cx_cw, cy_cw) == (0.5, 0.5)
+
+
 # Test for curve below y=0 (entire curve submerged)
 def test_curve_below_y0():
     curve_points_submerged = [
@@ -354,6 +368,40 @@ def test_find_draft_offset_at_vertical_equilibrium_skimming_up():
     assert draft_offset == -1.5
 
 
+def test_find_draft_offset_at_vertical_equilibrium_area_tolerance():
+    """A loose area tolerance still lands within the requested area budget."""
+    target_area = 6.0
+    tolerance_area = 0.5
+    curve_points = close_curve(
+        [
+            [0.0, 2.0],
+            [2.0, 3.0],
+            [4.0, 2.0],
+            [3.0, -2.0],
+            [1.0, -2.0],
+            [-1.0, 0.0],
+        ]
+    )
+    draft_offset_tight = find_draft_offset_at_vertical_equilibrium(
+        target_displacement_area=target_area, curve_points=curve_points
+    )
+    draft_offset_loose = find_draft_offset_at_vertical_equilibrium(
+        target_displacement_area=target_area,
+        curve_points=curve_points,
+        tolerance_area=tolerance_area,
+    )
+
+    # The loose solve must stay within tolerance_area of the target area...
+    shifted_points = [[p[0], p[1] - draft_offset_loose] for p in curve_points]
+    area, _, _, _ = compute_submerged_area_and_centroid(shifted_points)
+    assert np.isclose(area, target_area, atol=tolerance_area)
+
+    # ...and within tolerance_area / hull_width of the full-precision draft
+    # (the width is the Lipschitz constant of area with respect to draft)
+    hull_width = 4.0 - (-1.0)
+    assert abs(draft_offset_loose - draft_offset_tight) <= tolerance_area / hull_width
+
+
 def test_find_draft_offset_at_vertical_equilibrium_sinking():
     with pytest.raises(ValueError):
         _ = find_draft_offset_at_vertical_equilibrium(
@@ -432,3 +480,23 @@ def test_find_equilibrium_points():
         plot=False,
     )
     numpy.testing.assert_almost_equal(eq, [-90, 0, 90, 180])
+
+
+def test_find_equilibrium_points_coarse_step():
+    """A coarser scanning grid still recovers the rectangle equilibria.
+
+    The bracketing solver refines each sign change to full accuracy, so a
+    larger angle_step_deg only risks missing equilibria narrower than the
+    step, not losing precision on the ones it finds.
+    """
+    curve_points = close_curve([[-1, 0], [1, 0], [1, 1], [-1, 1]])
+    center_of_gravity = [0, 0.5]
+    target_area = 1.0
+    eq = find_equilibrium_points(
+        curve_points=curve_points,
+        center_of_gravity=center_of_gravity,
+        target_area=target_area,
+        plot=False,
+        angle_step_deg=5.0,
+    )
+    numpy.testing.assert_almost_equal(eq, [-90, 0, 90, 180])